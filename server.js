@@ -34,29 +34,51 @@ const DOMAIN_OPTIONS = [
 ];
 
 const sessions = new Map();
+const sessionLastSeen = new Map();
+const SESSION_TTL_MS = 12 * 60 * 60 * 1000;
 
 function ensureDir(dirPath) {
   fs.mkdirSync(dirPath, { recursive: true });
 }
 
+const jsonFileCache = new Map();
+
+function jsonFileStatKey(filePath) {
+  const stat = fs.statSync(filePath, { bigint: true });
+  return `${stat.mtimeNs}:${stat.size}`;
+}
+
 function readJson(filePath) {
+  let statKey;
   try {
-    if (!fs.existsSync(filePath)) {
-      return [];
-    }
-    const raw = fs.readFileSync(filePath, 'utf8');
-    if (!raw.trim()) {
-      return [];
-    }
-    return JSON.parse(raw);
+    statKey = jsonFileStatKey(filePath);
   } catch (error) {
+    jsonFileCache.delete(filePath);
     return [];
   }
+  const cached = jsonFileCache.get(filePath);
+  if (cached && cached.statKey === statKey) {
+    return cached.data;
+  }
+  let data;
+  try {
+    const raw = fs.readFileSync(filePath);
+    data = raw.length ? JSON.parse(raw) : [];
+  } catch (error) {
+    data = [];
+  }
+  jsonFileCache.set(filePath, { statKey, data });
+  return data;
 }
 
 function writeJson(filePath, data) {
   ensureDir(path.dirname(filePath));
   fs.writeFileSync(filePath, JSON.stringify(data, null, 2), 'utf8');
+  try {
+    jsonFileCache.set(filePath, { statKey: jsonFileStatKey(filePath), data });
+  } catch (error) {
+    jsonFileCache.delete(filePath);
+  }
 }
 
 function uuidToBytes(uuid) {
@@ -96,7 +118,7 @@ function normalizeCorrectAnswers(rawAnswers, choices) {
   }
   const answers = Array.isArray(rawAnswers) ? rawAnswers : [rawAnswers];
   const normalized = new Set();
-  const lowerChoices = choices.map((choice) => choice.toLowerCase());
+  let lowerChoices = null;
   for (const answer of answers) {
     if (typeof answer === 'number' && Number.isInteger(answer)) {
       if (answer >= 0 && answer < choices.length) {
@@ -117,6 +139,9 @@ function normalizeCorrectAnswers(rawAnswers, choices) {
         }
       }
       const lowered = trimmed.toLowerCase();
+      if (!lowerChoices) {
+        lowerChoices = choices.map((choice) => choice.toLowerCase());
+      }
       const matchIndex = lowerChoices.indexOf(lowered);
       if (matchIndex !== -1) {
         normalized.add(matchIndex);
@@ -126,6 +151,25 @@ function normalizeCorrectAnswers(rawAnswers, choices) {
   return Array.from(normalized).sort((a, b) => a - b);
 }
 
+function normalizeAnswerIndexes(values, choiceCount) {
+  let previous = -1;
+  let alreadyNormalized = true;
+  for (const value of values) {
+    if (!Number.isInteger(value) || value <= previous || value >= choiceCount) {
+      alreadyNormalized = false;
+      break;
+    }
+    previous = value;
+  }
+  if (alreadyNormalized) {
+    return values;
+  }
+  const parsed = values
+    .map((value) => Number.parseInt(value, 10))
+    .filter((value) => Number.isInteger(value) && value >= 0 && value < choiceCount);
+  return Array.from(new Set(parsed)).sort((a, b) => a - b);
+}
+
 function normalizeQuestion(rawQuestion) {
   if (!rawQuestion || typeof rawQuestion !== 'object') {
     throw new Error('Question must be an object');
@@ -158,8 +202,7 @@ function normalizeQuestion(rawQuestion) {
   const providedId = rawQuestion.id || rawQuestion.uuid;
   let questionId = providedId ? String(providedId) : null;
   if (!questionId) {
-    const namespace = uuidv5(questionText, DNS_NAMESPACE);
-    questionId = uuidv5('cissp-question', namespace);
+    questionId = uuidv5(`cissp-question::${questionText}`, DNS_NAMESPACE);
   }
   return {
     id: questionId,
@@ -232,9 +275,7 @@ function sanitizeGroup(rawGroup) {
     }
     const choices = rawChoices.map((choice) => choice.toString());
     const correctAnswers = Array.isArray(rawQuestion.correct_answers)
-      ? rawQuestion.correct_answers
-          .map((value) => Number.parseInt(value, 10))
-          .filter((value) => Number.isInteger(value) && value >= 0 && value < choices.length)
+      ? normalizeAnswerIndexes(rawQuestion.correct_answers, choices.length)
       : normalizeCorrectAnswers(
           rawQuestion.correct_answers || rawQuestion.correct_answer || rawQuestion.answers,
           choices,
@@ -250,7 +291,7 @@ function sanitizeGroup(rawGroup) {
       id: questionId,
       question: questionText,
       choices,
-      correct_answers: Array.from(new Set(correctAnswers)).sort((a, b) => a - b),
+      correct_answers: correctAnswers,
       explanation,
     });
   }
@@ -265,8 +306,7 @@ function sanitizeGroup(rawGroup) {
   };
 }
 
-function loadQuestionBank() {
-  const raw = readJson(QUESTIONS_FILE);
+function buildQuestionBank(raw) {
   if (Array.isArray(raw)) {
     const groups = [];
     for (const item of raw) {
@@ -298,6 +338,10 @@ function loadQuestionBank() {
   return { version: QUESTION_BANK_VERSION, groups: [] };
 }
 
+function loadQuestionBank() {
+  return buildQuestionBank(readJson(QUESTIONS_FILE));
+}
+
 function saveQuestionBank(bank) {
   if (!bank || typeof bank !== 'object') {
     writeJson(QUESTIONS_FILE, { version: QUESTION_BANK_VERSION, groups: [] });
@@ -336,9 +380,7 @@ function flattenQuestionBank(bank) {
         continue;
       }
       const correctAnswers = Array.isArray(question.correct_answers)
-        ? question.correct_answers
-            .map((value) => Number.parseInt(value, 10))
-            .filter((value) => Number.isInteger(value) && value >= 0 && value < choices.length)
+        ? normalizeAnswerIndexes(question.correct_answers, choices.length)
         : normalizeCorrectAnswers(question.correct_answers, choices);
       if (!correctAnswers.length) {
         continue;
@@ -349,7 +391,7 @@ function flattenQuestionBank(bank) {
         id,
         question: text,
         choices,
-        correct_answers: Array.from(new Set(correctAnswers)).sort((a, b) => a - b),
+        correct_answers: correctAnswers,
         comment: explanation,
         explanation,
         domain,
@@ -389,9 +431,7 @@ function buildGroupSummaries(bank) {
         continue;
       }
       const correctAnswers = Array.isArray(rawQuestion.correct_answers)
-        ? rawQuestion.correct_answers
-            .map((value) => Number.parseInt(value, 10))
-            .filter((value) => Number.isInteger(value) && value >= 0 && value < choices.length)
+        ? normalizeAnswerIndexes(rawQuestion.correct_answers, choices.length)
         : normalizeCorrectAnswers(rawQuestion.correct_answers, choices);
       if (!correctAnswers.length) {
         continue;
@@ -408,7 +448,7 @@ function buildGroupSummaries(bank) {
         id: questionId,
         question: questionText,
         choices,
-        correct_answers: Array.from(new Set(correctAnswers)).sort((a, b) => a - b),
+        correct_answers: correctAnswers,
         explanation,
         comment: explanation,
         domain,
@@ -460,20 +500,41 @@ function removeEmptyGroups(bank) {
   return bank;
 }
 
+let questionContextCache = { raw: null, value: null };
+
 function loadQuestionContext() {
-  const bank = loadQuestionBank();
+  const raw = readJson(QUESTIONS_FILE);
+  if (questionContextCache.raw === raw) {
+    return questionContextCache.value;
+  }
+  const bank = buildQuestionBank(raw);
   const groups = buildGroupSummaries(bank);
   const questions = flattenQuestionBank(bank);
   const domainSource = groups.length ? groups : questions;
   const domains = Array.from(new Set(domainSource.map((item) => item.domain || 'General'))).sort();
-  return {
+  const questionsById = new Map(questions.map((question) => [question.id, question]));
+  const groupsByDomain = new Map();
+  for (const group of groups) {
+    const key = group.domain || 'General';
+    const bucket = groupsByDomain.get(key);
+    if (bucket) {
+      bucket.push(group);
+    } else {
+      groupsByDomain.set(key, [group]);
+    }
+  }
+  const value = {
     bank,
     questions,
     groups,
     domains,
+    questionsById,
+    groupsByDomain,
     questionCount: questions.length,
     groupCount: groups.length,
   };
+  questionContextCache = { raw, value };
+  return value;
 }
 
 function buildExportPayload(bank, selectedGroupIds) {
@@ -680,6 +741,17 @@ function importQuestions(rawData) {
       groupIndexById.set(String(group.id), index);
     }
   });
+  const questionLocationById = new Map();
+  for (const group of bank.groups) {
+    if (!group || !Array.isArray(group.questions)) {
+      continue;
+    }
+    for (const question of group.questions) {
+      if (question && question.id !== undefined && question.id !== null) {
+        questionLocationById.set(String(question.id), { group, question });
+      }
+    }
+  }
 
   let imported = 0;
   let updated = 0;
@@ -742,21 +814,26 @@ function importQuestions(rawData) {
       targetGroup.questions = [];
     }
     for (const question of incoming.questions) {
-      const location = findQuestionLocation(bank, question.id);
-      if (location) {
-        const { groupIndex: existingGroupIndex, questionIndex } = location;
-        const existingGroup = bank.groups[existingGroupIndex];
-        if (existingGroup && Array.isArray(existingGroup.questions)) {
-          if (existingGroupIndex === groupIndex) {
-            existingGroup.questions[questionIndex] = question;
+      const existing = questionLocationById.get(String(question.id));
+      if (existing && Array.isArray(existing.group.questions)) {
+        const questionIndex = existing.group.questions.indexOf(existing.question);
+        if (existing.group === targetGroup) {
+          if (questionIndex !== -1) {
+            targetGroup.questions[questionIndex] = question;
           } else {
-            existingGroup.questions.splice(questionIndex, 1);
             targetGroup.questions.push(question);
           }
+        } else {
+          if (questionIndex !== -1) {
+            existing.group.questions.splice(questionIndex, 1);
+          }
+          targetGroup.questions.push(question);
         }
+        questionLocationById.set(String(question.id), { group: targetGroup, question });
         updated += 1;
       } else {
         targetGroup.questions.push(question);
+        questionLocationById.set(String(question.id), { group: targetGroup, question });
         imported += 1;
       }
     }
@@ -972,7 +1049,7 @@ function collectRelevantSnippets(knowledgeBase, question, limit = 5) {
     const chunks = Array.isArray(doc.chunks) ? doc.chunks : [];
     chunks.forEach((chunk, index) => {
       const text = (chunk && chunk.text ? chunk.text : '').toString();
-      const score = scoreChunk(queryTokens, text);
+      const score = scoreChunk(queryTokens, getChunkTokenCounts(chunk, text));
       scored.push({
         score,
         text,
@@ -1709,21 +1786,33 @@ function tokenize(text) {
     .filter(Boolean);
 }
 
-function scoreChunk(queryTokens, chunkTextValue) {
-  if (!queryTokens.length) {
-    return 0;
-  }
-  const chunkTokens = tokenize(chunkTextValue);
-  if (!chunkTokens.length) {
-    return 0;
+const chunkTokenCountCache = new WeakMap();
+
+function getChunkTokenCounts(chunk, chunkTextValue) {
+  const cacheable = chunk && typeof chunk === 'object';
+  if (cacheable) {
+    const cached = chunkTokenCountCache.get(chunk);
+    if (cached) {
+      return cached;
+    }
   }
   const counts = new Map();
-  for (const token of chunkTokens) {
+  for (const token of tokenize(chunkTextValue)) {
     counts.set(token, (counts.get(token) || 0) + 1);
   }
+  if (cacheable) {
+    chunkTokenCountCache.set(chunk, counts);
+  }
+  return counts;
+}
+
+function scoreChunk(queryTokens, tokenCounts) {
+  if (!queryTokens.length || !tokenCounts.size) {
+    return 0;
+  }
   let score = 0;
   for (const token of queryTokens) {
-    score += counts.get(token) || 0;
+    score += tokenCounts.get(token) || 0;
   }
   return score;
 }
@@ -1757,15 +1846,17 @@ async function extractTextFromFile(upload) {
   return upload.content.toString('utf8');
 }
 
-function updateWrongAnswers(questionId, selectedIndices, isCorrect) {
-  const wrongAnswers = loadWrongAnswers();
+function buildWrongAnswerLookup(wrongAnswers) {
   const lookup = new Map();
   for (const item of wrongAnswers) {
     if (item && item.question_id) {
       lookup.set(item.question_id, item);
     }
   }
-  const timestamp = new Date().toISOString();
+  return lookup;
+}
+
+function updateWrongAnswers(lookup, questionId, selectedIndices, isCorrect, timestamp) {
   if (lookup.has(questionId)) {
     const entry = { ...lookup.get(questionId) };
     const attempts = Number.isFinite(entry.retry_attempts) ? entry.retry_attempts : 0;
@@ -1778,7 +1869,6 @@ function updateWrongAnswers(questionId, selectedIndices, isCorrect) {
     entry.last_attempt = timestamp;
     entry.last_answer = selectedIndices;
     lookup.set(questionId, entry);
-    saveWrongAnswers(Array.from(lookup.values()));
     return;
   }
   if (!isCorrect) {
@@ -1790,7 +1880,6 @@ function updateWrongAnswers(questionId, selectedIndices, isCorrect) {
       retry_attempts: 0,
       retry_correct: 0,
     });
-    saveWrongAnswers(Array.from(lookup.values()));
   }
 }
 
@@ -1823,17 +1912,41 @@ function parseCookies(cookieHeader) {
   return result;
 }
 
+function pruneExpiredSessions(now) {
+  for (const [sid, lastSeen] of sessionLastSeen) {
+    if (now - lastSeen > SESSION_TTL_MS) {
+      sessionLastSeen.delete(sid);
+      sessions.delete(sid);
+    }
+  }
+}
+
 function getSession(req, res) {
   const cookies = parseCookies(req.headers.cookie || '');
   let sid = cookies.session_id;
+  const now = Date.now();
   if (!sid || !sessions.has(sid)) {
+    pruneExpiredSessions(now);
     sid = crypto.randomUUID();
     sessions.set(sid, {});
     res.setHeader('Set-Cookie', `session_id=${sid}; HttpOnly; Path=/`);
   }
+  sessionLastSeen.set(sid, now);
   return sessions.get(sid);
 }
 
+function dataStateETag(...filePaths) {
+  const parts = [];
+  for (const filePath of filePaths) {
+    try {
+      parts.push(jsonFileStatKey(filePath));
+    } catch (error) {
+      parts.push('absent');
+    }
+  }
+  return `W/"${crypto.createHash('sha1').update(parts.join('|')).digest('hex').slice(0, 16)}"`;
+}
+
 function sendHtml(res, html, status = 200) {
   res.statusCode = status;
   res.setHeader('Content-Type', 'text/html; charset=utf-8');
@@ -1846,17 +1959,21 @@ function redirect(res, location) {
   res.end();
 }
 
+const HTML_ESCAPE_RE = /[&<>"']/g;
+const HTML_ESCAPES = {
+  '&': '&amp;',
+  '<': '&lt;',
+  '>': '&gt;',
+  '"': '&quot;',
+  "'": '&#39;',
+};
+
 function escapeHtml(value) {
-  return String(value)
-    .replace(/&/g, '&amp;')
-    .replace(/</g, '&lt;')
-    .replace(/>/g, '&gt;')
-    .replace(/"/g, '&quot;')
-    .replace(/'/g, '&#39;');
+  return String(value).replace(HTML_ESCAPE_RE, (char) => HTML_ESCAPES[char]);
 }
 
 function encodeJsonForHtml(value) {
-  return JSON.stringify(value).replace(/</g, '\\u003c').replace(/>/g, '\\u003e');
+  return JSON.stringify(value).replace(/[<>]/g, (char) => (char === '<' ? '\\u003c' : '\\u003e'));
 }
 
 function formatDateTime(value) {
@@ -3517,12 +3634,18 @@ function parseMultipartFormData(bodyBuffer, boundary) {
     const contentTypeLine = headers.find((line) => /^content-type/i.test(line));
     const contentType = contentTypeLine ? contentTypeLine.split(':').slice(1).join(':').trim() : 'text/plain';
     if (filenameMatch && filenameMatch[1]) {
+      let decodedText;
       result.files.push({
         name: fieldName,
         filename: filenameMatch[1],
         contentType,
         content: value,
-        text: value.toString('utf8'),
+        get text() {
+          if (decodedText === undefined) {
+            decodedText = value.toString('utf8');
+          }
+          return decodedText;
+        },
       });
     } else {
       result.fields.set(fieldName, value.toString('utf8'));
@@ -3540,11 +3663,27 @@ function addFlash(session, category, message) {
 
 function takeRandomSample(items, count) {
   const copy = items.slice();
-  for (let i = copy.length - 1; i > 0; i -= 1) {
-    const j = crypto.randomInt(0, i + 1);
+  const sampleSize = Math.min(Math.max(count, 0), copy.length);
+  for (let i = 0; i < sampleSize; i += 1) {
+    const j = crypto.randomInt(i, copy.length);
     [copy[i], copy[j]] = [copy[j], copy[i]];
   }
-  return copy.slice(0, count);
+  copy.length = sampleSize;
+  return copy;
+}
+
+function resolveTestQuestions(currentTest, questionsById) {
+  if (!currentTest || !Array.isArray(currentTest.questionIds)) {
+    return [];
+  }
+  const resolved = [];
+  for (const questionId of currentTest.questionIds) {
+    const question = questionsById.get(questionId);
+    if (question) {
+      resolved.push(question);
+    }
+  }
+  return resolved;
 }
 
 const server = http.createServer(async (req, res) => {
@@ -3593,12 +3732,15 @@ const server = http.createServer(async (req, res) => {
       return;
     }
 
-    const { bank, questions, groups, domains, questionCount, groupCount } = loadQuestionContext();
+    const { bank, questions, groups, domains, questionsById, groupsByDomain, questionCount, groupCount } =
+      loadQuestionContext();
     const wrongAnswers = loadWrongAnswers();
-    const knowledgeBase = loadKnowledgeBase();
-    const createdDefaultChat = ensureDefaultChat(knowledgeBase);
-    if (createdDefaultChat) {
-      saveKnowledgeBase(knowledgeBase);
+    let knowledgeBase = null;
+    if (pathname === '/learning' || pathname.startsWith('/learning/')) {
+      knowledgeBase = loadKnowledgeBase();
+      if (ensureDefaultChat(knowledgeBase)) {
+        saveKnowledgeBase(knowledgeBase);
+      }
     }
 
     if (pathname === '/questions' && req.method === 'GET') {
@@ -3732,7 +3874,7 @@ const server = http.createServer(async (req, res) => {
 
     if (pathname === '/questions/view' && req.method === 'GET') {
       const id = requestUrl.searchParams.get('id') || '';
-      const question = questions.find((item) => item.id === id);
+      const question = questionsById.get(id);
       if (!question) {
         addFlash(session, 'warning', 'Question not found.');
         redirect(res, '/questions');
@@ -3755,7 +3897,7 @@ const server = http.createServer(async (req, res) => {
 
     if (pathname === '/questions/edit' && req.method === 'GET') {
       const id = requestUrl.searchParams.get('id') || '';
-      const question = questions.find((item) => item.id === id);
+      const question = questionsById.get(id);
       if (!question) {
         addFlash(session, 'warning', 'Question not found.');
         redirect(res, '/questions');
@@ -3780,8 +3922,8 @@ const server = http.createServer(async (req, res) => {
       const bodyBuffer = await collectRequestBody(req);
       const formData = new URLSearchParams(bodyBuffer.toString());
       const id = formData.get('id') || '';
-      const index = questions.findIndex((item) => item.id === id);
-      if (index === -1) {
+      const existingQuestion = questionsById.get(id);
+      if (!existingQuestion) {
         addFlash(session, 'warning', 'Question not found.');
         redirect(res, '/questions');
         return;
@@ -3819,7 +3961,7 @@ const server = http.createServer(async (req, res) => {
       }
       if (errors.length) {
         const draft = {
-          ...questions[index],
+          ...existingQuestion,
           question: questionText,
           domain: domainInput,
           choices,
@@ -3885,15 +4027,9 @@ const server = http.createServer(async (req, res) => {
         targetGroup.questions.splice(location.questionIndex, 1);
       }
       saveQuestionBank(removeEmptyGroups(bank));
-      let wrongModified = false;
-      for (let i = wrongAnswers.length - 1; i >= 0; i -= 1) {
-        if (wrongAnswers[i] && wrongAnswers[i].question_id === id) {
-          wrongAnswers.splice(i, 1);
-          wrongModified = true;
-        }
-      }
-      if (wrongModified) {
-        saveWrongAnswers(wrongAnswers);
+      const remainingWrongAnswers = wrongAnswers.filter((item) => !item || item.question_id !== id);
+      if (remainingWrongAnswers.length !== wrongAnswers.length) {
+        saveWrongAnswers(remainingWrongAnswers);
       }
       addFlash(session, 'success', 'Question deleted.');
       redirect(res, `/questions?page=${page}`);
@@ -3967,9 +4103,18 @@ const server = http.createServer(async (req, res) => {
     }
 
     if (req.method === 'GET' && pathname === '/') {
+      const etag = dataStateETag(QUESTIONS_FILE, WRONG_FILE);
+      if (!flashMessages.length) {
+        res.setHeader('ETag', etag);
+        if (req.headers['if-none-match'] === etag) {
+          res.statusCode = 304;
+          res.end();
+          return;
+        }
+      }
       const wrongDetails = wrongAnswers.map((item) => ({
         ...item,
-        question: questions.find((q) => q.id === item.question_id) || null,
+        question: questionsById.get(item.question_id) || null,
       }));
       const body = renderIndex({
         questionCount,
@@ -4229,7 +4374,7 @@ const server = http.createServer(async (req, res) => {
           const boundary = boundaryMatch ? boundaryMatch[1] : '';
           const parsed = parseMultipartFormData(bodyBuffer, boundary);
           const uploaded = parsed.files.find(
-            (file) => file.name === 'questions_file' && typeof file.text === 'string' && file.text.trim(),
+            (file) => file.name === 'questions_file' && typeof file.text === 'string' && /\S/.test(file.text),
           );
           if (uploaded) {
             payloadText = uploaded.text;
@@ -4267,14 +4412,13 @@ const server = http.createServer(async (req, res) => {
           }
           return;
         }
-        const trimmedPayload = (payloadText || '').trim();
-        if (!trimmedPayload) {
+        if (!/\S/.test(payloadText || '')) {
           addFlash(session, 'danger', 'Provide questions JSON by pasting data or uploading a file.');
           redirect(res, '/import/json');
           return;
         }
         try {
-          const parsed = JSON.parse(trimmedPayload);
+          const parsed = JSON.parse(payloadText);
           const stats = importQuestions(parsed);
           addFlash(session, 'success', `Imported ${stats.imported} questions, updated ${stats.updated}.`);
           redirect(res, '/');
@@ -4349,14 +4493,13 @@ const server = http.createServer(async (req, res) => {
         const trimmedAiSource = (aiSource || '').trim();
         const aiDomainValue = resolveDomainInput(aiDomain, aiCustomDomain, '');
         if (importMode === 'ai_confirm') {
-          const trimmedPayload = (aiPayload || '').trim();
-          if (!trimmedPayload) {
+          if (!/\S/.test(aiPayload || '')) {
             addFlash(session, 'danger', 'The AI preview payload was missing. Please run the analysis again.');
             redirect(res, '/import/ai');
             return;
           }
           try {
-            const parsed = JSON.parse(trimmedPayload);
+            const parsed = JSON.parse(aiPayload);
             const stats = importQuestions(parsed);
             addFlash(session, 'success', `Imported ${stats.imported} questions, updated ${stats.updated}.`);
             redirect(res, '/');
@@ -4456,7 +4599,7 @@ const server = http.createServer(async (req, res) => {
         const bodyBuffer = await collectRequestBody(req);
         const formData = new URLSearchParams(bodyBuffer.toString());
         const domain = formData.get('domain') || '';
-        const filteredGroups = groups.filter((group) => !domain || group.domain === domain);
+        const filteredGroups = domain ? groupsByDomain.get(domain) || [] : groups;
         if (!filteredGroups.length) {
           addFlash(session, 'warning', 'No question groups available for the selected criteria.');
           redirect(res, '/test/new');
@@ -4468,25 +4611,23 @@ const server = http.createServer(async (req, res) => {
           Math.min(Number.isFinite(requested) ? requested : filteredGroups.length, filteredGroups.length),
         );
         const selectedGroups = takeRandomSample(filteredGroups, totalGroups);
-        const selectedQuestions = [];
+        const questionIds = [];
         for (const group of selectedGroups) {
           if (!group || !Array.isArray(group.questions)) {
             continue;
           }
           for (const question of group.questions) {
-            selectedQuestions.push({
-              ...question,
-            });
+            questionIds.push(question.id);
           }
         }
-        if (!selectedQuestions.length) {
+        if (!questionIds.length) {
           addFlash(session, 'warning', 'The selected groups did not contain any questions.');
           redirect(res, '/test/new');
           return;
         }
         session.currentTest = {
-          questions: selectedQuestions,
-          timestamp: new Date().toISOString(),
+          questionIds,
+          timestamp: Date.now(),
           mode: 'standard',
         };
         redirect(res, '/test');
@@ -4497,12 +4638,13 @@ const server = http.createServer(async (req, res) => {
     if (pathname === '/test') {
       if (req.method === 'GET') {
         const currentTest = session.currentTest;
-        if (!currentTest || !Array.isArray(currentTest.questions) || !currentTest.questions.length) {
+        const testQuestions = resolveTestQuestions(currentTest, questionsById);
+        if (!testQuestions.length) {
           addFlash(session, 'info', 'Start a test to access this page.');
           redirect(res, '/test/new');
           return;
         }
-        const body = renderTest({ questions: currentTest.questions, mode: currentTest.mode || 'standard' });
+        const body = renderTest({ questions: testQuestions, mode: currentTest.mode || 'standard' });
         sendHtml(
           res,
           renderLayout({
@@ -4520,7 +4662,8 @@ const server = http.createServer(async (req, res) => {
 
     if (pathname === '/test/submit' && req.method === 'POST') {
       const currentTest = session.currentTest;
-      if (!currentTest || !Array.isArray(currentTest.questions) || !currentTest.questions.length) {
+      const testQuestions = resolveTestQuestions(currentTest, questionsById);
+      if (!testQuestions.length) {
         addFlash(session, 'warning', 'No active test found.');
         redirect(res, '/test/new');
         return;
@@ -4529,16 +4672,19 @@ const server = http.createServer(async (req, res) => {
       const formData = new URLSearchParams(bodyBuffer.toString());
       const results = [];
       let correctCount = 0;
-      for (const question of currentTest.questions) {
+      const wrongLookup = buildWrongAnswerLookup(wrongAnswers);
+      const submittedAt = new Date().toISOString();
+      for (const question of testQuestions) {
         const key = `q_${question.id}`;
         const selectedValues = formData.getAll(key).map((value) => Number.parseInt(value, 10)).filter((value) => Number.isInteger(value));
-        const selected = Array.from(new Set(selectedValues)).sort((a, b) => a - b);
-        const correctAnswers = Array.isArray(question.correct_answers) ? question.correct_answers.slice().sort((a, b) => a - b) : [];
-        const isCorrect = selected.length === correctAnswers.length && selected.every((value, index) => value === correctAnswers[index]);
+        const selectedSet = new Set(selectedValues);
+        const selected = Array.from(selectedSet);
+        const correctAnswers = Array.isArray(question.correct_answers) ? question.correct_answers : [];
+        const isCorrect = selectedSet.size === correctAnswers.length && correctAnswers.every((value) => selectedSet.has(value));
         if (isCorrect) {
           correctCount += 1;
         }
-        updateWrongAnswers(question.id, selected, isCorrect);
+        updateWrongAnswers(wrongLookup, question.id, selected, isCorrect, submittedAt);
         results.push({
           question,
           selected,
@@ -4546,7 +4692,8 @@ const server = http.createServer(async (req, res) => {
           correct_answers: correctAnswers,
         });
       }
-      const totalQuestions = currentTest.questions.length;
+      saveWrongAnswers(Array.from(wrongLookup.values()));
+      const totalQuestions = testQuestions.length;
       const score = totalQuestions ? Math.round((correctCount / totalQuestions) * 10000) / 100 : 0;
       session.lastResults = {
         results,
@@ -4585,8 +4732,19 @@ const server = http.createServer(async (req, res) => {
 
     if (pathname === '/review') {
       if (req.method === 'GET') {
+        const etag = dataStateETag(QUESTIONS_FILE, WRONG_FILE);
+        if (!flashMessages.length) {
+          res.setHeader('ETag', etag);
+          if (req.headers['if-none-match'] === etag) {
+            res.statusCode = 304;
+            res.end();
+            return;
+          }
+        }
         const wrongLookup = Object.fromEntries(wrongAnswers.map((item) => [item.question_id, item]));
-        const reviewQuestions = questions.filter((question) => wrongLookup[question.id]);
+        const reviewQuestions = wrongAnswers
+          .map((item) => questionsById.get(item.question_id))
+          .filter((question) => question);
         const body = renderReview({ reviewQuestions, wrongLookup });
         sendHtml(
           res,
@@ -4602,8 +4760,9 @@ const server = http.createServer(async (req, res) => {
         return;
       }
       if (req.method === 'POST') {
-        const wrongLookup = Object.fromEntries(wrongAnswers.map((item) => [item.question_id, item]));
-        const reviewQuestions = questions.filter((question) => wrongLookup[question.id]);
+        const reviewQuestions = wrongAnswers
+          .map((item) => questionsById.get(item.question_id))
+          .filter((question) => question);
         if (!reviewQuestions.length) {
           addFlash(session, 'info', 'There are no questions to review right now.');
           redirect(res, '/review');
@@ -4615,8 +4774,8 @@ const server = http.createServer(async (req, res) => {
         const totalQuestions = Math.max(1, Math.min(Number.isFinite(requested) ? requested : reviewQuestions.length, reviewQuestions.length));
         const selected = takeRandomSample(reviewQuestions, totalQuestions);
         session.currentTest = {
-          questions: selected,
-          timestamp: new Date().toISOString(),
+          questionIds: selected.map((question) => question.id),
+          timestamp: Date.now(),
           mode: 'review',
         };
         redirect(res, '/test');